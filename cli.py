@@ -16,6 +16,7 @@ Usage examples
 """
 import argparse
 import json
+import logging
 import sys
 from datetime import datetime
 from typing import Any, Dict
@@ -521,6 +522,9 @@ def _run_idea_engine(
 
 def main() -> None:
     """Main CLI entry point."""
+    # Per-file progress from the asset/narration modules goes through
+    # logging; surface it on the CLI without per-message stdout flushes
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = build_parser()
     args = parser.parse_args()
     try:
@@ -40,12 +40,30 @@ class Config:
     VIDEO_HEIGHT = 1080
     VIDEO_FPS = 30
 
+    # Encoder settings ("faster" cuts encode time dramatically over "slow"
+    # with little visible quality loss on slideshow content; use X264_CRF to
+    # trade size for quality)
+    X264_PRESET = os.getenv("X264_PRESET", "faster")
+    X264_CRF = os.getenv("X264_CRF", "20")
+
+    # Hardware H.264 encoder: "auto" probes ffmpeg for NVENC/QSV/VideoToolbox,
+    # "none" forces software libx264, or name an encoder explicitly
+    HW_ENCODER = os.getenv("HW_ENCODER", "auto").strip().lower()
+
+    # Render Ken Burns frames in Python (PIL) and pipe raw video into the
+    # encoder instead of using ffmpeg's zoompan filter; lets frame generation
+    # overlap the encode
+    KENBURNS_PIPE = os.getenv("KENBURNS_PIPE", "false").strip().lower() in {"1", "true", "yes", "on"}
+
     # Audio settings
     VOICE_LANGUAGE = os.getenv("VOICE_LANGUAGE", "en")
     VOICE_SPEED = float(os.getenv("VOICE_SPEED", "0.9"))
     MUSIC_VOLUME = float(os.getenv("MUSIC_VOLUME", "0.2"))
     MUSIC_DUCK_DB = float(os.getenv("MUSIC_DUCK_DB", "6.0"))
     MUSIC_FADE_MS = int(os.getenv("MUSIC_FADE_MS", "2500"))
+    # Loudness-normalize the narration; disabling it lets the no-music path
+    # reuse the voice file as-is instead of decoding and re-encoding it
+    AUDIO_NORMALIZE = os.getenv("AUDIO_NORMALIZE", "true").strip().lower() in {"1", "true", "yes", "on"}
 
     # Optional YouTube music fallback (royalty-free links only)
     MUSIC_YOUTUBE_URL = os.getenv("MUSIC_YOUTUBE_URL", "").strip()
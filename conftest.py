@@ -0,0 +1,62 @@
+"""Shared pytest fixtures for the pipeline test suite."""
+import shutil
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def cfg():
+    """Config class with output/temp/cache directories ensured once per session."""
+    from config import Config
+
+    Config.ensure_directories()
+    return Config
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Stub LLM credentials and routing for tests.
+
+    Sets a fake OpenAI key and replaces call_llm with a canned response so
+    generator classes construct and run without real keys, network access,
+    or exception-driven key-presence branches.
+    """
+    import llm_client
+    import script_generator
+    from config import Config
+
+    def _canned_response(**kwargs):
+        return "SECTION 1: Stub Section\nStub content for testing.\n\nCTA:\nSubscribe."
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(Config, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(llm_client, "call_llm", _canned_response)
+    monkeypatch.setattr(script_generator, "call_llm", _canned_response)
+    return _canned_response
+
+
+@pytest.fixture(scope="session")
+def ffmpeg_available(request):
+    """Whether FFmpeg is usable, probed once per session.
+
+    The result is persisted in pytest's cache keyed on the ffmpeg binary's
+    path and mtime, so warm local runs skip the subprocess probe entirely.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return False
+
+    mtime = Path(ffmpeg_path).stat().st_mtime
+    cached = request.config.cache.get("pipeline/ffmpeg", None)
+    if cached and cached.get("path") == ffmpeg_path and cached.get("mtime") == mtime:
+        return cached["available"]
+
+    from video_compositor import VideoCompositor
+
+    available = VideoCompositor().check_ffmpeg()
+    request.config.cache.set(
+        "pipeline/ffmpeg",
+        {"path": ffmpeg_path, "mtime": mtime, "available": available},
+    )
+    return available
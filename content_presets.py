@@ -5,6 +5,7 @@ Defines two channel presets:
   - devotional:      Radha Krishna devotional / spirituality
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import List, Dict
 
@@ -242,8 +243,13 @@ PRESETS: Dict[str, ContentPreset] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_preset(name: str) -> ContentPreset:
-    """Return a preset by name, raising ValueError if not found."""
+    """Return a preset by name, raising ValueError if not found.
+
+    Lookups are memoized; presets are shared registry objects, so callers
+    always receive the same instance either way.
+    """
     if name not in PRESETS:
         raise ValueError(
             f"Unknown preset '{name}'. Available presets: {list(PRESETS.keys())}"
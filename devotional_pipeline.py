@@ -1,4 +1,5 @@
 """Main orchestrator for devotional video generation pipeline."""
+import logging
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -201,6 +202,10 @@ def main():
     try:
         _configure_console_encoding()
 
+        # Per-file progress from the asset/narration modules goes through
+        # logging; surface it when run as a script
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
         # Validate configuration
         Config.validate_config()
         
@@ -20,7 +20,7 @@ import hashlib
 import json
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from config import Config
 
@@ -85,6 +85,29 @@ def set_cached(key: str, value: Any, subdir: str) -> None:
         json.dump(envelope, fh, indent=2, default=str)
 
 
+def set_many(pairs: Dict[str, Any], subdir: str) -> None:
+    """
+    Persist many key → value pairs under *subdir* in a single pass.
+
+    The cache directory is created once and the per-entry envelope writes
+    share a single timestamp, so batching N entries avoids N directory
+    stat/mkdir round trips compared to calling :func:`set_cached` N times.
+
+    Parameters
+    ----------
+    pairs:  Mapping of cache keys (from :func:`make_cache_key`) to values.
+    subdir: Sub-directory name, e.g. ``"scripts"``, ``"titles"``, ``"shorts"``.
+    """
+    cache_dir = Config.CACHE_DIR / subdir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    for key, value in pairs.items():
+        envelope = {"key": key, "subdir": subdir, "ts": now, "value": value}
+        (cache_dir / f"{key}.json").write_text(
+            json.dumps(envelope, indent=2, default=str), encoding="utf-8"
+        )
+
+
 def get_cached_audio_path(key: str) -> Optional[Path]:
     """
     Return the path to a cached TTS audio file, or ``None`` if not cached.
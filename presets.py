@@ -3,6 +3,7 @@
 Each preset defines long-form script structure, shorts structure,
 image search queries, rotating themes, and platform packaging guidance.
 """
+import functools
 from typing import Any, Dict, List
 
 # ---------------------------------------------------------------------------
@@ -389,6 +390,7 @@ NICHE_PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_preset(niche: str) -> Dict[str, Any]:
     """Return preset for a given niche key (case-insensitive)."""
     key = niche.lower().replace("-", "_")
@@ -398,6 +400,7 @@ def get_preset(niche: str) -> Dict[str, Any]:
     return NICHE_PRESETS[key]
 
 
+@functools.lru_cache(maxsize=None)
 def get_cost_tier(tier: str) -> Dict[str, Any]:
     """Return cost tier configuration."""
     if tier not in COST_TIERS:
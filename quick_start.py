@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import logging
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -93,34 +94,41 @@ def run_dry_run(args: argparse.Namespace, preset) -> None:
     wpm = WORDS_PER_MINUTE.get(args.tier, 130)
     duration = Config.VIDEO_DURATION_MINUTES
 
-    print("\n" + "=" * 65)
-    print("DRY-RUN ESTIMATE (no paid API calls made)")
-    print("=" * 65)
-    print(f"  Preset  : {args.preset}")
-    print(f"  Theme   : {theme}")
-    print(f"  Output  : {args.output}")
-    print(f"  Tier    : {args.tier}")
-    print()
+    # Buffer the report and emit it with a single write
+    lines = [
+        "",
+        "=" * 65,
+        "DRY-RUN ESTIMATE (no paid API calls made)",
+        "=" * 65,
+        f"  Preset  : {args.preset}",
+        f"  Theme   : {theme}",
+        f"  Output  : {args.output}",
+        f"  Tier    : {args.tier}",
+        "",
+    ]
 
     api_calls = 0
 
     if args.output in ("long", "both"):
         target_words = duration * wpm
         approx_tokens = int(target_words * 1.4)
-        print(f"  Long script     : ~{target_words} words  →  ~{approx_tokens} tokens  (1 API call)")
-        print(f"  Titles          : ~100 tokens  (1 API call)")
-        print(f"  Thumbnail texts : ~75 tokens   (1 API call)")
+        lines.append(f"  Long script     : ~{target_words} words  →  ~{approx_tokens} tokens  (1 API call)")
+        lines.append("  Titles          : ~100 tokens  (1 API call)")
+        lines.append("  Thumbnail texts : ~75 tokens   (1 API call)")
         api_calls += 3
 
     if args.output in ("shorts", "both"):
         est = shorts_dry_run_estimate({"full_script": "", "segments": []}, count=args.shorts_count)
-        print(f"  Shorts          : {est['shorts_that_will_be_produced']} shorts  "
-              f"(0 extra API calls — extracted from long script)")
+        lines.append(f"  Shorts          : {est['shorts_that_will_be_produced']} shorts  "
+                     f"(0 extra API calls — extracted from long script)")
 
-    print()
-    print(f"  Total estimated API calls : {api_calls}")
-    print(f"  Caching                   : enabled — re-runs with same inputs = 0 calls")
-    print("=" * 65 + "\n")
+    lines.extend([
+        "",
+        f"  Total estimated API calls : {api_calls}",
+        "  Caching                   : enabled — re-runs with same inputs = 0 calls",
+        "=" * 65 + "\n",
+    ])
+    print("\n".join(lines))
 
 
 def generate_long(args: argparse.Namespace, preset, theme: str) -> dict:
@@ -291,8 +299,15 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main(argv: list[str] | None = None) -> int:
+    # Per-file progress from the asset/narration modules goes through
+    # logging; surface it on the CLI without per-message stdout flushes
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     parser = build_parser()
-    args = parser.parse_args(argv)
+    return run(parser.parse_args(argv))
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute the pipeline for an already-parsed argument namespace."""
     args.shorts_count = max(1, min(8, args.shorts_count))
 
     Config.ensure_directories()
@@ -7,7 +7,6 @@ Supports:
 - Dry-run mode that estimates token usage without calling the API
 - Shorts/reels scripts derived from the long-form script
 """
-import openai
 import warnings
 from typing import Any, Dict, List, Optional
 
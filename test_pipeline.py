@@ -1,413 +1,293 @@
-"""Test script to validate the devotional pipeline modules."""
+"""Test suite validating the devotional pipeline modules.
+
+Run with ``pytest test_pipeline.py`` (add ``-n auto`` to parallelize with
+pytest-xdist) or directly with ``python test_pipeline.py``.
+"""
+import re
 import sys
-from pathlib import Path
+
+import pytest
+
+# Shared validators for preset templates: both placeholders must appear in the
+# long-form user template, and platform cues must cover exactly these targets.
+_TEMPLATE_PLACEHOLDERS = re.compile(r"\{theme\}|\{duration_minutes\}")
+_EXPECTED_CUES = frozenset({"youtube_long", "youtube_shorts", "instagram_reels"})
+
+# Minimal structured script used by the shorts-extraction tests; built once
+# at module scope so repeated/parametrized runs don't re-allocate it.
+SAMPLE_SCRIPT = (
+    "HOOK: Did you know AI can replace your marketing team?\n"
+    "You are about to discover 5 tools that do exactly that.\n\n"
+    "PROMISE: In this video you will learn the top tools and how to use them.\n\n"
+    "SECTION 1: Tool One\n"
+    "This is the first major point. It covers many things about AI and productivity. "
+    "Use it every day to save hours. Many entrepreneurs rely on it for content. "
+    "Results are immediate and the pricing is fair for most budgets.\n\n"
+    "SECTION 2: Tool Two\n"
+    "This is the second major point. It focuses on automation and scheduling. "
+    "You can integrate it with your existing workflow. "
+    "Teams of all sizes benefit from this approach.\n\n"
+    "SECTION 3: Tool Three\n"
+    "This is the third major point. Analytics and insights are the core feature. "
+    "It helps you understand your audience. Data drives better decisions always.\n\n"
+    "RECAP: Quick summary of the three tools and how they help.\n"
+    "CTA: Like and subscribe for more AI tips every week!\n"
+)
+
+
+@pytest.fixture(scope="module")
+def sample_script_data():
+    """Structured script payload shared by the shorts-extraction tests."""
+    return {"full_script": SAMPLE_SCRIPT, "segments": []}
+
 
 def test_imports():
-    """Test that all modules can be imported."""
-    print("Testing imports...")
-    try:
-        from config import Config
-        from script_generator import DevotionalScriptGenerator
-        from voice_narrator import VoiceNarrator
-        from visual_assets import VisualAssetFetcher
-        from music_handler import BackgroundMusicHandler
-        from video_compositor import VideoCompositor
-        from channel_presets import get_preset, CHANNEL_A_FINANCE, CHANNEL_B_DEVOTION
-        from shorts_extractor import ShortsExtractor
-        from content_cache import ContentCache
-        print("✓ All modules imported successfully")
-        return True
-    except Exception as e:
-        print(f"✗ Import error: {e}")
-        return False
-
-def test_config():
-    """Test configuration module."""
-    print("\nTesting configuration...")
-    try:
-        from config import Config
-        
-        # Ensure directories are created
-        Config.ensure_directories()
-        
-        # Check directories exist
-        assert Config.OUTPUT_DIR.exists(), "Output directory not created"
-        assert Config.TEMP_DIR.exists(), "Temp directory not created"
-        
-        # Check settings
-        assert Config.VIDEO_DURATION_MINUTES == 30, "Duration should be 30 minutes"
-        assert Config.VIDEO_WIDTH == 1920, "Width should be 1920"
-        assert Config.VIDEO_HEIGHT == 1080, "Height should be 1080"
-
-        # New cost/safety controls
-        assert Config.MAX_TOKENS > 0, "MAX_TOKENS should be positive"
-        assert Config.MAX_RETRIES > 0, "MAX_RETRIES should be positive"
-        assert Config.MAX_IMAGES > 0, "MAX_IMAGES should be positive"
-        assert Config.MAX_TTS_CHARS > 0, "MAX_TTS_CHARS should be positive"
-        assert isinstance(Config.ENABLE_CACHE, bool), "ENABLE_CACHE should be bool"
-        assert Config.RATE_LIMIT_PER_MINUTE > 0, "RATE_LIMIT_PER_MINUTE should be positive"
-        
-        print("✓ Configuration working correctly")
-        print(f"  Output dir: {Config.OUTPUT_DIR}")
-        print(f"  Temp dir: {Config.TEMP_DIR}")
-        print(f"  Duration: {Config.VIDEO_DURATION_MINUTES} minutes")
-        print(f"  MAX_TOKENS: {Config.MAX_TOKENS}")
-        print(f"  ENABLE_CACHE: {Config.ENABLE_CACHE}")
-        return True
-    except Exception as e:
-        print(f"✗ Config error: {e}")
-        return False
+    """All pipeline modules can be imported."""
+    from config import Config
+    from script_generator import DevotionalScriptGenerator
+    from voice_narrator import VoiceNarrator
+    from visual_assets import VisualAssetFetcher
+    from music_handler import BackgroundMusicHandler
+    from video_compositor import VideoCompositor
+    from channel_presets import get_preset, CHANNEL_A_FINANCE, CHANNEL_B_DEVOTION
+    from shorts_extractor import ShortsExtractor
+    from content_cache import ContentCache
+
+
+def test_config(cfg):
+    """Configuration module creates directories and exposes settings."""
+    # Check directories exist (the cfg fixture ensures them once per session)
+    assert cfg.OUTPUT_DIR.exists(), "Output directory not created"
+    assert cfg.TEMP_DIR.exists(), "Temp directory not created"
+
+    # Check settings
+    assert cfg.VIDEO_DURATION_MINUTES == 30, "Duration should be 30 minutes"
+    assert cfg.VIDEO_WIDTH == 1920, "Width should be 1920"
+    assert cfg.VIDEO_HEIGHT == 1080, "Height should be 1080"
+
+    # New cost/safety controls
+    assert cfg.MAX_TOKENS > 0, "MAX_TOKENS should be positive"
+    assert cfg.MAX_RETRIES > 0, "MAX_RETRIES should be positive"
+    assert cfg.MAX_IMAGES > 0, "MAX_IMAGES should be positive"
+    assert cfg.MAX_TTS_CHARS > 0, "MAX_TTS_CHARS should be positive"
+    assert isinstance(cfg.ENABLE_CACHE, bool), "ENABLE_CACHE should be bool"
+    assert cfg.RATE_LIMIT_PER_MINUTE > 0, "RATE_LIMIT_PER_MINUTE should be positive"
+
+
+def test_config_guardrails():
+    """The guardrail summary returned by Config.get_guardrails() is valid."""
+    from config import Config
+
+    guardrails = Config.get_guardrails()
+
+    required = {"max_tokens", "max_images", "max_tts_chars", "max_retries", "enable_cache"}
+    missing = required - guardrails.keys()
+    assert not missing, f"guardrail keys missing: {sorted(missing)}"
+
+    assert guardrails["max_tokens"] > 0
+    assert guardrails["max_images"] > 0
+    assert guardrails["max_tts_chars"] > 0
+    assert guardrails["max_retries"] >= 1
+    assert isinstance(guardrails["enable_cache"], bool)
+
 
 def test_music_handler():
-    """Test music handler module."""
-    print("\nTesting music handler...")
-    try:
-        from music_handler import BackgroundMusicHandler
-        
-        handler = BackgroundMusicHandler()
-        
-        # Test getting sources
-        sources = handler.get_royalty_free_sources()
-        assert len(sources) > 0, "Should have music sources"
-        print(f"✓ Found {len(sources)} royalty-free music sources")
-        
-        # Test requirements
-        requirements = handler.get_music_requirements()
-        assert 'duration' in requirements, "Should have duration requirement"
-        print("✓ Music requirements generated")
-        
-        # Test instructions
-        instructions = handler.setup_music_instructions()
-        assert len(instructions) > 0, "Should have instructions"
-        print("✓ Music setup instructions generated")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Music handler error: {e}")
-        return False
+    """Music handler exposes sources, requirements, and instructions."""
+    from music_handler import BackgroundMusicHandler
+
+    handler = BackgroundMusicHandler()
+
+    sources = handler.get_royalty_free_sources()
+    assert len(sources) > 0, "Should have music sources"
+
+    requirements = handler.get_music_requirements()
+    assert 'duration' in requirements, "Should have duration requirement"
+
+    instructions = handler.setup_music_instructions()
+    assert len(instructions) > 0, "Should have instructions"
+
 
 def test_visual_queries():
-    """Test visual asset queries."""
-    print("\nTesting visual asset queries...")
-    try:
-        from visual_assets import VisualAssetFetcher
-        
-        fetcher = VisualAssetFetcher()
-        queries = fetcher.get_devotional_queries()
-        
-        assert len(queries) > 0, "Should have devotional queries"
-        print(f"✓ Found {len(queries)} devotional search queries")
-        print(f"  Examples: {queries[:3]}")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Visual assets error: {e}")
-        return False
-
-def test_weekly_themes():
-    """Test script generator themes."""
-    print("\nTesting weekly themes...")
-    try:
-        from script_generator import DevotionalScriptGenerator
-        
-        # This will fail without API key, but we can test theme list
-        try:
-            generator = DevotionalScriptGenerator()
-            themes = generator.get_weekly_themes()
-            
-            assert len(themes) == 12, "Should have 12 weekly themes"
-            print(f"✓ Found {len(themes)} weekly themes")
-            print(f"  Theme 1: {themes[0]}")
-            print(f"  Theme 2: {themes[1]}")
-            
-            return True
-        except ValueError as e:
-            if "OpenAI API key" in str(e):
-                print("⚠ Skipped (requires OpenAI API key)")
-                return True
-            raise
-            
-    except Exception as e:
-        print(f"✗ Script generator error: {e}")
-        return False
-
-def test_ffmpeg():
-    """Test FFmpeg availability."""
-    print("\nTesting FFmpeg...")
-    try:
-        from video_compositor import VideoCompositor
-        
-        compositor = VideoCompositor()
-        has_ffmpeg = compositor.check_ffmpeg()
-        
-        if has_ffmpeg:
-            print("✓ FFmpeg is installed and available")
-            return True
-        else:
-            print("✗ FFmpeg is not installed")
-            print("  Install with: sudo apt-get install ffmpeg")
-            return False
-            
-    except Exception as e:
-        print(f"✗ FFmpeg check error: {e}")
-        return False
+    """Visual asset fetcher provides devotional search queries."""
+    from visual_assets import VisualAssetFetcher
+
+    fetcher = VisualAssetFetcher()
+    queries = fetcher.get_devotional_queries()
+
+    assert len(queries) > 0, "Should have devotional queries"
+
+    # Guard against a duplicate class definition shadowing the real one:
+    # these attributes vanish if a stripped-down copy wins the name
+    assert fetcher.google_image_model
+    assert fetcher._sanitize_query("Lotus Flower!") == "lotus_flower"
+
+
+def test_weekly_themes(fake_llm):
+    """Script generator provides 12 weekly themes."""
+    from script_generator import DevotionalScriptGenerator
+
+    generator = DevotionalScriptGenerator()
+    themes = generator.get_weekly_themes()
+    assert len(themes) == 12, "Should have 12 weekly themes"
+
+
+def test_ffmpeg(ffmpeg_available):
+    """FFmpeg is installed and available."""
+    if not ffmpeg_available:
+        pytest.skip("FFmpeg not installed (install with: sudo apt-get install ffmpeg)")
+
 
 def test_content_presets():
-    """Test content preset system."""
-    print("\nTesting content presets...")
-    try:
-        from content_presets import get_preset, PRESETS
-
-        # Both required presets must exist
-        assert "finance_ai_saas" in PRESETS, "finance_ai_saas preset missing"
-        assert "devotional" in PRESETS, "devotional preset missing"
-
-        for name in ("finance_ai_saas", "devotional"):
-            preset = get_preset(name)
-            assert preset.name == name
-            assert preset.long_form_system_prompt
-            assert "{theme}" in preset.long_form_user_template
-            assert "{duration_minutes}" in preset.long_form_user_template
-            assert len(preset.default_themes) >= 1
-            assert set(preset.platform_cues.keys()) == {
-                "youtube_long", "youtube_shorts", "instagram_reels"
-            }
-            assert preset.title_prompt_template
-            assert preset.thumbnail_prompt_template
-            assert len(preset.default_broll_keywords) >= 3
-
-        # Unknown preset raises ValueError
-        try:
-            get_preset("nonexistent")
-            assert False, "Should have raised ValueError"
-        except ValueError:
-            pass
-
-        print(f"✓ Content presets validated ({len(PRESETS)} presets)")
-        return True
-    except Exception as e:
-        print(f"✗ Content presets error: {e}")
-        return False
-
-
-def test_shorts_extractor():
-    """Test shorts extraction module."""
-    print("\nTesting shorts extractor...")
-    try:
-        from shorts_extractor import extract_shorts, shorts_dry_run_estimate
-
-        # Build a minimal structured script
-        sample_script = (
-            "HOOK: Did you know AI can replace your marketing team?\n"
-            "You are about to discover 5 tools that do exactly that.\n\n"
-            "PROMISE: In this video you will learn the top tools and how to use them.\n\n"
-            "SECTION 1: Tool One\n"
-            "This is the first major point. It covers many things about AI and productivity. "
-            "Use it every day to save hours. Many entrepreneurs rely on it for content. "
-            "Results are immediate and the pricing is fair for most budgets.\n\n"
-            "SECTION 2: Tool Two\n"
-            "This is the second major point. It focuses on automation and scheduling. "
-            "You can integrate it with your existing workflow. "
-            "Teams of all sizes benefit from this approach.\n\n"
-            "SECTION 3: Tool Three\n"
-            "This is the third major point. Analytics and insights are the core feature. "
-            "It helps you understand your audience. Data drives better decisions always.\n\n"
-            "RECAP: Quick summary of the three tools and how they help.\n"
-            "CTA: Like and subscribe for more AI tips every week!\n"
-        )
-        script_data = {"full_script": sample_script, "segments": []}
-
-        # Default count
-        shorts = extract_shorts(script_data, count=4)
-        assert isinstance(shorts, list)
-        assert 1 <= len(shorts) <= 4
-        for s in shorts:
-            assert "hook" in s
-            assert "body" in s
-            assert "cta" in s
-            assert "caption_text" in s
-            assert "broll_keywords" in s
-            assert isinstance(s["broll_keywords"], list)
-            assert len(s["caption_text"]) <= 63  # 60 chars + optional "..."
-
-        # Dry-run estimate (no API calls)
-        est = shorts_dry_run_estimate(script_data, count=4)
-        assert est["api_calls_required"] == 0
-        assert "shorts_that_will_be_produced" in est
-
-        # Count clamping
-        shorts_max = extract_shorts(script_data, count=100)
-        assert len(shorts_max) <= 8
-
-        print(f"✓ Shorts extractor: produced {len(shorts)} shorts from sample script")
-        return True
-    except Exception as e:
-        print(f"✗ Shorts extractor error: {e}")
-        return False
-
-
-def test_pipeline_cache():
-    """Test disk-based caching module."""
-    print("\nTesting pipeline cache...")
-    try:
-        import tempfile, os
-        from unittest.mock import patch
-        from pathlib import Path
-        from config import Config
-
-        # Point cache to a temp directory for this test
-        with tempfile.TemporaryDirectory() as tmp:
-            with patch.object(Config, "CACHE_DIR", Path(tmp)):
-                from pipeline_cache import get_cached, set_cached, make_cache_key
-
-                key = make_cache_key(theme="test", preset="devotional", tier="free")
-
-                # Miss
-                assert get_cached(key, "scripts") is None
-
-                # Set and hit
-                payload = {"script": "hello world", "titles": ["Title 1"]}
-                set_cached(key, payload, "scripts")
-                retrieved = get_cached(key, "scripts")
-                assert retrieved == payload
-
-                # Different kwargs → different key
-                key2 = make_cache_key(theme="other", preset="devotional", tier="free")
-                assert key != key2
-                assert get_cached(key2, "scripts") is None
-
-        print("✓ Pipeline cache: set/get/miss working correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Pipeline cache error: {e}")
-        return False
+    """Content preset system exposes valid presets."""
+    from content_presets import get_preset, PRESETS
+
+    # Both required presets must exist
+    assert "finance_ai_saas" in PRESETS, "finance_ai_saas preset missing"
+    assert "devotional" in PRESETS, "devotional preset missing"
+
+    for name in ("finance_ai_saas", "devotional"):
+        preset = get_preset(name)
+        assert preset.name == name
+        assert preset.long_form_system_prompt
+        placeholders = set(_TEMPLATE_PLACEHOLDERS.findall(preset.long_form_user_template))
+        assert placeholders == {"{theme}", "{duration_minutes}"}
+        assert len(preset.default_themes) >= 1
+        assert preset.platform_cues.keys() == _EXPECTED_CUES
+        assert preset.title_prompt_template
+        assert preset.thumbnail_prompt_template
+        assert len(preset.default_broll_keywords) >= 3
+
+    # Unknown preset raises ValueError
+    with pytest.raises(ValueError):
+        get_preset("nonexistent")
+
+
+def test_shorts_extractor(sample_script_data):
+    """Shorts extraction produces valid shorts from a structured script."""
+    from shorts_extractor import extract_shorts, shorts_dry_run_estimate
+
+    script_data = sample_script_data
+
+    # Default count — validate all shorts in a single pass with set operations
+    shorts = extract_shorts(script_data, count=4)
+    assert isinstance(shorts, list)
+    assert 1 <= len(shorts) <= 4
+    required_keys = {"hook", "body", "cta", "caption_text", "broll_keywords"}
+    assert all(required_keys <= s.keys() for s in shorts)
+    assert all(isinstance(s["broll_keywords"], list) for s in shorts)
+    # 60 chars + optional "..."
+    assert max((len(s["caption_text"]) for s in shorts), default=0) <= 63
+
+    # Dry-run estimate (no API calls)
+    est = shorts_dry_run_estimate(script_data, count=4)
+    assert est["api_calls_required"] == 0
+    assert "shorts_that_will_be_produced" in est
+
+    # Count clamping
+    shorts_max = extract_shorts(script_data, count=100)
+    assert len(shorts_max) <= 8
+
+
+def test_pipeline_cache(tmp_path, monkeypatch):
+    """Disk-based cache supports set/get/miss round trips."""
+    from config import Config
+    from pipeline_cache import get_cached, set_cached, set_many, make_cache_key
+
+    # Point cache to a per-test temp directory
+    monkeypatch.setattr(Config, "CACHE_DIR", tmp_path)
+
+    key = make_cache_key(theme="test", preset="devotional", tier="free")
+
+    # Miss
+    assert get_cached(key, "scripts") is None
+
+    # Set and hit
+    payload = {"script": "hello world", "titles": ["Title 1"]}
+    set_cached(key, payload, "scripts")
+    retrieved = get_cached(key, "scripts")
+    assert retrieved == payload
+
+    # Different kwargs → different key
+    key2 = make_cache_key(theme="other", preset="devotional", tier="free")
+    assert key != key2
+    assert get_cached(key2, "scripts") is None
+
+    # Batch write: many entries in one call, all retrievable
+    pairs = {
+        make_cache_key(theme=f"t{i}", preset="devotional", tier="free"):
+            {"script": f"s{i}"}
+        for i in range(100)
+    }
+    set_many(pairs, "scripts")
+    assert all(
+        get_cached(k, "scripts") == v for k, v in pairs.items()
+    )
 
 
 def test_cost_controls():
-    """Test that cost control constants are present in Config."""
-    print("\nTesting cost controls in Config...")
-    try:
-        from config import Config
-
-        assert hasattr(Config, "MAX_TOKENS_PER_CALL"), "MAX_TOKENS_PER_CALL missing"
-        assert hasattr(Config, "MAX_RETRIES"), "MAX_RETRIES missing"
-        assert hasattr(Config, "MAX_SCENES_PER_RUN"), "MAX_SCENES_PER_RUN missing"
-        assert hasattr(Config, "MAX_TTS_CHARS"), "MAX_TTS_CHARS missing"
-        assert hasattr(Config, "CACHE_DIR"), "CACHE_DIR missing"
-        assert hasattr(Config, "API_KEY"), "API_KEY missing"
-        assert hasattr(Config, "RATE_LIMIT_PER_MINUTE"), "RATE_LIMIT_PER_MINUTE missing"
-
-        assert Config.MAX_TOKENS_PER_CALL > 0
-        assert Config.MAX_RETRIES >= 1
-        assert Config.MAX_SCENES_PER_RUN > 0
-        assert Config.MAX_TTS_CHARS > 0
-        assert Config.RATE_LIMIT_PER_MINUTE > 0
-
-        print("✓ All cost control constants present and valid")
-        return True
-    except Exception as e:
-        print(f"✗ Cost controls error: {e}")
-        return False
-
-
-def test_cli_dry_run():
-    """Test the quick_start CLI --dry-run flag (no paid API calls)."""
-    print("\nTesting CLI --dry-run...")
-    try:
-        from quick_start import main as cli_main
-
-        # Should succeed without any API keys
-        exit_code = cli_main(
-            ["--preset", "finance_ai_saas", "--output", "both", "--dry-run"]
-        )
-        assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
-
-        exit_code2 = cli_main(
-            ["--preset", "devotional", "--output", "long", "--dry-run"]
-        )
-        assert exit_code2 == 0
-
-        print("✓ CLI --dry-run works for both presets")
-        return True
-    except Exception as e:
-        print(f"✗ CLI dry-run error: {e}")
-        return False
+    """Cost control constants are present in Config."""
+    from config import Config
+
+    required = {
+        "MAX_TOKENS_PER_CALL", "MAX_RETRIES", "MAX_SCENES_PER_RUN",
+        "MAX_TTS_CHARS", "CACHE_DIR", "API_KEY", "RATE_LIMIT_PER_MINUTE",
+    }
+    missing = {name for name in required if not hasattr(Config, name)}
+    assert not missing, f"cost control constants missing: {sorted(missing)}"
+
+    assert Config.MAX_TOKENS_PER_CALL > 0
+    assert Config.MAX_RETRIES >= 1
+    assert Config.MAX_SCENES_PER_RUN > 0
+    assert Config.MAX_TTS_CHARS > 0
+    assert Config.RATE_LIMIT_PER_MINUTE > 0
+
+
+@pytest.fixture(scope="module")
+def cli_parser():
+    """Build the quick_start argument parser once for all CLI tests."""
+    from quick_start import build_parser
+
+    return build_parser()
+
+
+@pytest.mark.parametrize(
+    "preset,output",
+    [("finance_ai_saas", "both"), ("devotional", "long")],
+)
+def test_cli_dry_run(cli_parser, preset, output):
+    """The quick_start CLI --dry-run flag works without paid API calls."""
+    from quick_start import run as cli_run
+
+    # Should succeed without any API keys
+    args = cli_parser.parse_args(["--preset", preset, "--output", output, "--dry-run"])
+    exit_code = cli_run(args)
+    assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
+
+
+@pytest.mark.parametrize("niche", ["finance", "ai_saas", "passive_income", "devotion"])
+def test_cost_estimator(niche):
+    """Dry-run cost estimation works for every niche without API calls."""
+    from script_generator import ContentScriptGenerator
+
+    generator = ContentScriptGenerator(niche=niche, dry_run=True)
+    estimate = generator.estimate_cost()
+
+    required = {"estimated_cost_usd", "model", "estimated_input_tokens", "estimated_output_tokens"}
+    assert required <= estimate.keys()
+    assert estimate["estimated_cost_usd"] >= 0
+    assert estimate["estimated_output_tokens"] > 0
+    assert estimate["niche"] == niche
 
 
 def test_api_server_imports():
-    """Test that the FastAPI server module can be imported."""
-    print("\nTesting API server imports...")
-    try:
-        import importlib.util
-        spec = importlib.util.find_spec("fastapi")
-        if spec is None:
-            print("⚠ Skipped (fastapi not installed)")
-            return True
-
-        from api_server import app, check_api_key, check_rate_limit
-        assert app is not None
-        print("✓ API server module imported successfully")
-        return True
-    except Exception as e:
-        print(f"✗ API server import error: {e}")
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("=" * 70)
-    print("🎬  MULTIMODAL CONTENT PIPELINE - MODULE VALIDATION")
-    print("=" * 70)
-
-    tests = [
-        ("Module Imports", test_imports),
-        ("Configuration", test_config),
-        ("Config Guardrails", test_config_guardrails),
-        ("Music Handler", test_music_handler),
-        ("Visual Queries", test_visual_queries),
-        ("Weekly Themes", test_weekly_themes),
-        ("FFmpeg Check", test_ffmpeg),
-        ("Content Presets", test_content_presets),
-        ("Shorts Extractor", test_shorts_extractor),
-        ("Pipeline Cache", test_pipeline_cache),
-        ("Cost Controls", test_cost_controls),
-        ("CLI Dry-Run", test_cli_dry_run),
-        ("API Server Imports", test_api_server_imports),
-    ]
-
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"✗ Test failed with exception: {e}")
-            results.append((test_name, False))
-
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for test_name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {test_name}")
-
-    print(f"\nTotal: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("\n✨ All tests passed! Pipeline modules are ready.")
-        print("\nNext steps:")
-        print("  1. Copy .env.example to .env")
-        print("  2. Add your API keys to .env")
-        print("  3. Run: python cli.py --channel B --output both  (devotion)")
-        print("         python cli.py --channel A --output both  (finance)")
-        return 0
-    else:
-        print("\n⚠️  Some tests failed. Please fix issues before running pipeline.")
-        return 1
+    """The FastAPI server module can be imported."""
+    pytest.importorskip("fastapi", reason="fastapi not installed")
+
+    from api_server import app, check_api_key, check_rate_limit
+    assert app is not None
+
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # Rerun previously failing tests first so the edit/test loop only pays
+    # for what broke; falls back to the full suite when everything passed.
+    sys.exit(pytest.main([__file__, "-v", "--lf"]))
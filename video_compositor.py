@@ -1,4 +1,7 @@
 """Video compositor for assembling devotional videos."""
+import functools
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 import subprocess
@@ -8,6 +11,98 @@ from pydub import effects
 import math
 import re
 
+
+# Sentence boundary used when chunking narration into subtitles
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Music bed gain relative to the voice — fixed by Config, so computed once
+# (-120 dB effectively mutes the bed when MUSIC_VOLUME is zero)
+_MUSIC_GAIN_DB = (
+    -120.0 if Config.MUSIC_VOLUME <= 0 else 20.0 * math.log10(Config.MUSIC_VOLUME)
+) - Config.MUSIC_DUCK_DB
+
+
+# Hardware encoders run the Ken Burns slideshow many times faster than
+# software libx264; quality per bit on still-image content is comparable.
+_HW_ENCODER_ARGS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p5", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "h264_qsv": ["-c:v", "h264_qsv", "-preset", "veryfast", "-global_quality", "23"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "55"],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Return True if ffmpeg is on PATH; cached for the process lifetime.
+
+    A PATH lookup via shutil.which avoids spawning a subprocess; the
+    `ffmpeg -version` probe only runs if the lookup is inconclusive.
+    """
+    if shutil.which("ffmpeg"):
+        return True
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
+        return False
+
+
+def _hw_encoder_works(encoder: str) -> bool:
+    """Return True if ``encoder`` can actually encode a frame.
+
+    `ffmpeg -encoders` lists every encoder compiled in, including hardware
+    ones with no usable device behind them (the normal case on GPU-less
+    servers and CI), so a tiny lavfi test encode is the real check.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-v", "error",
+                "-f", "lavfi", "-i", "color=black:s=64x64:d=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> str:
+    """Return the preferred hardware H.264 encoder name, or '' for software.
+
+    Honours Config.HW_ENCODER: "none" disables detection, an explicit
+    encoder name is used as-is, and "auto" probes `ffmpeg -encoders` once,
+    then confirms the candidate with a throwaway test encode.
+    """
+    if Config.HW_ENCODER == "none":
+        return ""
+    if Config.HW_ENCODER and Config.HW_ENCODER != "auto":
+        return Config.HW_ENCODER
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return ""
+    if result.returncode != 0:
+        return ""
+
+    for encoder in ("h264_nvenc", "h264_qsv", "h264_videotoolbox"):
+        if encoder in result.stdout and _hw_encoder_works(encoder):
+            return encoder
+    return ""
+
 class VideoCompositor:
     """Compose final devotional video from visuals, voice, and music."""
     
@@ -17,6 +112,40 @@ class VideoCompositor:
         self.temp_dir = Config.TEMP_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # Audio durations cached per (path, mtime) — see _get_audio_duration
+        self._duration_cache = {}
+        # Filter fragments depend only on Config constants — build them once
+        self._base_vf = (
+            f"scale={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT}:force_original_aspect_ratio=increase,"
+            f"crop={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT}"
+        )
+        self._zoompan_tpl = (
+            "zoompan=z='min(zoom+0.0015,1.1)':d={d}"
+            ":x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":s={Config.VIDEO_WIDTH}x{Config.VIDEO_HEIGHT}:fps={Config.VIDEO_FPS}"
+        )
+
+    def _codec_args(self, software: bool = False) -> List[str]:
+        """Return encoder arguments for the slideshow encodes.
+
+        Prefers a detected hardware encoder; pass ``software=True`` to force
+        libx264 (used by the retry path so a failing hardware encoder cannot
+        take down every fallback level).
+        """
+        if not software:
+            hw = _detect_hw_encoder()
+            if hw in _HW_ENCODER_ARGS:
+                return list(_HW_ENCODER_ARGS[hw])
+        return [
+            "-c:v", "libx264",
+            "-preset", Config.X264_PRESET,
+            "-crf", Config.X264_CRF,
+            "-profile:v", "high",
+            "-level", "4.2",
+            # Let libx264 use every core; its defaults are conservative
+            "-threads", "0",
+            "-x264-params", "threads=auto:sliced-threads=0:rc-lookahead=20",
+        ]
     
     def create_video(
         self,
@@ -39,52 +168,161 @@ class VideoCompositor:
             Path to the generated video file
         """
         output_path = self.output_dir / output_filename
-        
+
         print("Starting video composition...")
-        
-        # Step 1: Prepare audio track (voice + music)
-        print("Preparing audio track...")
-        audio_path = self._prepare_audio(voice_audio, background_music)
-        
-        # Step 2: Get audio duration to match video length
-        audio_duration = self._get_audio_duration(audio_path)
-        
-        # Step 3: Create video from images with slow zoom/pan effects
-        print("Creating video from images...")
-        video_path = self._create_video_from_images(images, audio_duration)
-        
-        # Step 4: Combine video and audio
+
+        # The audio mix (amix duration=first) always matches the voice track,
+        # so once the voice duration is probed the audio-prep ffmpeg and the
+        # slideshow encode are independent and can run concurrently.
+        voice_duration = self._probe_duration(voice_audio)
+        if voice_duration is not None:
+            subtitle_file = None
+            if subtitle_text and Config.SUBTITLES_ENABLED:
+                subtitle_file = self._create_subtitle_file(
+                    subtitle_text, voice_duration
+                )
+
+            # Try the fused pipeline first: slideshow, subtitle burn, and
+            # audio mix in a single ffmpeg process with no intermediate files
+            final_path = self._create_video_single_pass(
+                images,
+                voice_audio,
+                background_music,
+                voice_duration,
+                output_path,
+                subtitle_file=subtitle_file,
+            )
+            if final_path:
+                print(f"✓ Video created successfully: {final_path}")
+                return final_path
+            print("Single-pass composition unavailable, using staged pipeline...")
+
+            print("Preparing audio track (in background)...")
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                audio_future = pool.submit(
+                    self._prepare_audio, voice_audio, background_music
+                )
+
+                print("Creating video from images...")
+                video_path = self._create_video_from_images(
+                    images, voice_duration, subtitle_file=subtitle_file
+                )
+                audio_path = audio_future.result()
+        else:
+            # ffprobe unavailable — fall back to the serial pipeline
+            print("Preparing audio track...")
+            audio_path = self._prepare_audio(voice_audio, background_music)
+            audio_duration = self._get_audio_duration(audio_path)
+
+            subtitle_file = None
+            if subtitle_text and Config.SUBTITLES_ENABLED:
+                subtitle_file = self._create_subtitle_file(
+                    subtitle_text, audio_duration
+                )
+
+            print("Creating video from images...")
+            video_path = self._create_video_from_images(
+                images, audio_duration, subtitle_file=subtitle_file
+            )
+
+        # Combine video and audio (stream copy — no re-encode)
         print("Combining video and audio...")
-        final_path = self._combine_video_and_audio(
-            video_path,
-            audio_path,
-            output_path,
-            subtitle_text=subtitle_text,
-        )
+        final_path = self._combine_video_and_audio(video_path, audio_path, output_path)
         
         print(f"✓ Video created successfully: {final_path}")
         return final_path
     
     def _prepare_audio(
-        self, 
-        voice_audio: Path, 
+        self,
+        voice_audio: Path,
         background_music: Path = None
     ) -> Path:
         """
         Combine voice narration with background music.
-        
+
+        Mixing runs inside a single ffmpeg process (loudnorm on the voice,
+        gain + fades on the music, amix to combine) — the music is looped by
+        the demuxer via -stream_loop rather than concatenated in Python.
+        Falls back to the pydub implementation if ffmpeg fails.
+
         Args:
             voice_audio: Path to voice narration
             background_music: Optional path to background music
-            
+
         Returns:
             Path to combined audio file
         """
-        output_path = self.temp_dir / "combined_audio.mp3"
-        
+        has_music = bool(background_music and background_music.exists())
+
+        # No music and no normalization requested — nothing to mix, so reuse
+        # the narration file as-is instead of a decode/re-encode round trip
+        if not has_music and not Config.AUDIO_NORMALIZE:
+            output_path = self.temp_dir / f"combined_audio{voice_audio.suffix}"
+            shutil.copyfile(voice_audio, output_path)
+            return output_path
+
+        # WAV intermediate: the final mux encodes AAC anyway, so an MP3 here
+        # would add a pointless lossy LAME pass between two other codecs
+        output_path = self.temp_dir / "combined_audio.wav"
+
+        voice_duration = self._probe_duration(voice_audio)
+        if voice_duration is not None:
+            cmd = ["ffmpeg", "-i", str(voice_audio)]
+            voice_chain = (
+                "loudnorm=I=-16:TP=-1.5:LRA=11" if Config.AUDIO_NORMALIZE else "anull"
+            )
+
+            if has_music:
+                fade_s = max(0, Config.MUSIC_FADE_MS) / 1000.0
+
+                music_chain = f"volume={_MUSIC_GAIN_DB:.2f}dB"
+                if fade_s > 0:
+                    fade_out_start = max(0.0, voice_duration - fade_s)
+                    music_chain += (
+                        f",afade=t=in:d={fade_s}"
+                        f",afade=t=out:st={fade_out_start}:d={fade_s}"
+                    )
+
+                cmd.extend(["-stream_loop", "-1", "-i", str(background_music)])
+                filter_complex = (
+                    f"[0:a]{voice_chain}[v];"
+                    f"[1:a]{music_chain}[m];"
+                    "[v][m]amix=inputs=2:duration=first:dropout_transition=0[a]"
+                )
+                cmd.extend(["-filter_complex", filter_complex, "-map", "[a]"])
+            else:
+                cmd.extend(["-af", voice_chain])
+
+            cmd.extend([
+                "-t", f"{voice_duration}",
+                "-c:a", "pcm_s16le",
+                "-y",
+                str(output_path),
+            ])
+
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                return output_path
+            print("FFmpeg audio mix failed, falling back to pydub...")
+
+        return self._prepare_audio_pydub(voice_audio, background_music, output_path)
+
+    def _prepare_audio_pydub(
+        self,
+        voice_audio: Path,
+        background_music: Path,
+        output_path: Path,
+    ) -> Path:
+        """Pydub-based fallback for combining voice and music.
+
+        Only reached when ffmpeg itself is unavailable or fails; the primary
+        path normalizes with ffmpeg's loudnorm (EBU R128, single pass in C)
+        instead of pydub's Python-level peak scan.
+        """
         # Load voice audio
         voice = AudioSegment.from_file(voice_audio)
-        voice = effects.normalize(voice, headroom=1.0)
+        if Config.AUDIO_NORMALIZE:
+            voice = effects.normalize(voice, headroom=1.0)
         
         if background_music and background_music.exists():
             # Load background music
@@ -96,10 +334,13 @@ class VideoCompositor:
             music_duration = len(music)
             
             if music_duration < voice_duration:
-                # Loop the music
-                loops_needed = math.ceil(voice_duration / music_duration)
-                music = music * loops_needed
-            
+                # Loop into a single pre-sized buffer; repeated `music * n`
+                # concatenation reallocates and copies the buffer every pass
+                bed = AudioSegment.silent(
+                    duration=voice_duration, frame_rate=music.frame_rate
+                )
+                music = bed.overlay(music, loop=True)
+
             # Trim music to match voice duration
             music = music[:voice_duration]
             
@@ -109,11 +350,7 @@ class VideoCompositor:
                 music = music.fade_in(fade_ms).fade_out(fade_ms)
 
             # Reduce music level relative to voice and add extra ducking headroom.
-            if Config.MUSIC_VOLUME <= 0:
-                gain_db = -120.0
-            else:
-                gain_db = 20.0 * math.log10(Config.MUSIC_VOLUME)
-            music = music.apply_gain(gain_db - Config.MUSIC_DUCK_DB)
+            music = music.apply_gain(_MUSIC_GAIN_DB)
             
             # Overlay music under voice
             combined = voice.overlay(music)
@@ -121,77 +358,123 @@ class VideoCompositor:
             combined = voice
         
         # Export combined audio
-        combined.export(output_path, format="mp3")
+        combined.export(output_path, format="wav")
         return output_path
     
+    def _probe_duration(self, audio_path: Path) -> float:
+        """Read a media file's duration (seconds) from its container header
+        via ffprobe, or return None if probing fails."""
+        try:
+            result = subprocess.run(
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries", "format=duration",
+                    "-of", "default=nw=1:nk=1",
+                    str(audio_path),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode == 0:
+                return float(result.stdout.strip())
+        except (FileNotFoundError, ValueError):
+            pass
+        return None
+
     def _get_audio_duration(self, audio_path: Path) -> float:
         """
         Get duration of audio file in seconds.
-        
+
+        Reads the container header via ffprobe instead of decoding the whole
+        file; results are cached per (path, mtime) so repeated queries for
+        the same file are free. Falls back to a pydub decode if probing fails.
+
         Args:
             audio_path: Path to audio file
-            
+
         Returns:
             Duration in seconds
         """
-        audio = AudioSegment.from_file(audio_path)
-        return len(audio) / 1000.0  # Convert ms to seconds
+        audio_path = Path(audio_path)
+        cache_key = (str(audio_path), audio_path.stat().st_mtime)
+        cached = self._duration_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        duration = self._probe_duration(audio_path)
+        if duration is None:
+            audio = AudioSegment.from_file(audio_path)
+            duration = len(audio) / 1000.0  # Convert ms to seconds
+
+        self._duration_cache[cache_key] = duration
+        return duration
     
     def _create_video_from_images(
-        self, 
-        images: List[Path], 
-        duration: float
+        self,
+        images: List[Path],
+        duration: float,
+        subtitle_file: Path = None,
     ) -> Path:
         """
         Create video slideshow from images with Ken Burns effect.
-        
+
         Args:
             images: List of image paths
             duration: Total duration in seconds
-            
+            subtitle_file: Optional SRT file to burn into the same encode
+
         Returns:
             Path to created video file
         """
         output_path = self.temp_dir / "slideshow.mp4"
-        
+
         if not images:
             raise ValueError("No images provided for video creation")
 
+        # zoompan resamples its input image for every output frame, so feed
+        # it stills pre-scaled near the target size instead of raw 4K photos
+        images = self._prescale_images(images)
+
+        if Config.KENBURNS_PIPE:
+            piped = self._create_video_via_pipe(
+                images, duration, subtitle_file=subtitle_file
+            )
+            if piped:
+                return piped
+            print("Piped Ken Burns encode failed, falling back to zoompan...")
+
         if len(images) > 1 and Config.TRANSITION_SECONDS > 0:
-            transitioned = self._create_video_with_transitions(images, duration)
+            transitioned = self._create_video_with_transitions(
+                images, duration, subtitle_file=subtitle_file
+            )
             if transitioned:
                 return transitioned
         
         # Calculate duration per image
         duration_per_image = duration / len(images)
         
-        # Create input file list for FFmpeg
+        # Create input file list for FFmpeg — built as one string and written
+        # in a single call; Path.absolute() is resolved once per image
         concat_file = self.temp_dir / "concat_list.txt"
-        with open(concat_file, "w") as f:
-            for img in images:
-                f.write(f"file '{img.absolute()}'\n")
-                f.write(f"duration {duration_per_image}\n")
+        absolute_paths = [img.absolute() for img in images]
+        concat_file.write_text(
+            "".join(
+                f"file '{path}'\nduration {duration_per_image}\n"
+                for path in absolute_paths
+            )
             # Add last image again (FFmpeg concat requirement)
-            f.write(f"file '{images[-1].absolute()}'\n")
-        
-        # Build FFmpeg video filter for Ken Burns effect
-        # 1. Scale and crop to target resolution
-        scale_filter = f"scale={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT}:force_original_aspect_ratio=increase"
-        crop_filter = f"crop={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT}"
+            + f"file '{absolute_paths[-1]}'\n"
+        )
         
-        # 2. Ken Burns effect (slow zoom)
+        # Ken Burns filter: precomputed scale/crop plus a slow zoom whose
+        # only per-call variable is the frame count per image
         zoom_duration_frames = int(duration_per_image * Config.VIDEO_FPS)
-        zoom_filter = (
-            f"zoompan=z='min(zoom+0.0015,1.1)'"
-            f":d={zoom_duration_frames}"
-            f":x='iw/2-(iw/zoom/2)'"
-            f":y='ih/2-(ih/zoom/2)'"
-            f":s={Config.VIDEO_WIDTH}x{Config.VIDEO_HEIGHT}"
-            f":fps={Config.VIDEO_FPS}"
+        video_filter = (
+            f"{self._base_vf},{self._zoompan_tpl.format(d=zoom_duration_frames)}"
         )
-        
-        # Combine filters
-        video_filter = f"{scale_filter},{crop_filter},{zoom_filter}"
+        subtitle_filter = self._subtitle_filter(subtitle_file)
+        if subtitle_filter:
+            video_filter = f"{video_filter},{subtitle_filter}"
         
         # FFmpeg command to create video with effects
         cmd = [
@@ -200,11 +483,7 @@ class VideoCompositor:
             "-safe", "0",
             "-i", str(concat_file),
             "-vf", video_filter,
-            "-c:v", "libx264",
-            "-preset", "slow",
-            "-crf", "20",
-            "-profile:v", "high",
-            "-level", "4.2",
+            *self._codec_args(),
             "-movflags", "+faststart",
             "-pix_fmt", "yuv420p",
             "-y",
@@ -217,7 +496,9 @@ class VideoCompositor:
         if result.returncode != 0:
             # Fallback to simpler method without zoom effect
             print("Trying simpler slideshow method...")
-            simple_filter = f"{scale_filter},{crop_filter}"
+            simple_filter = self._base_vf
+            if subtitle_filter:
+                simple_filter = f"{simple_filter},{subtitle_filter}"
             
             cmd_simple = [
                 "ffmpeg",
@@ -225,11 +506,7 @@ class VideoCompositor:
                 "-safe", "0",
                 "-i", str(concat_file),
                 "-vf", simple_filter,
-                "-c:v", "libx264",
-                "-preset", "slow",
-                "-crf", "20",
-                "-profile:v", "high",
-                "-level", "4.2",
+                *self._codec_args(software=True),
                 "-movflags", "+faststart",
                 "-pix_fmt", "yuv420p",
                 "-r", str(Config.VIDEO_FPS),
@@ -243,7 +520,154 @@ class VideoCompositor:
         
         return output_path
 
-    def _create_video_with_transitions(self, images: List[Path], duration: float) -> Path:
+    def _prescale_images(self, images: List[Path]) -> List[Path]:
+        """Downscale oversized stills to ~1.2x the target frame, once each.
+
+        Keeps enough headroom for the 1.1x Ken Burns zoom while sparing the
+        per-frame filters from resampling full-resolution stock photos.
+        Images already near target size — or any that fail to convert — are
+        passed through unchanged.
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return images
+
+        target_w = int(Config.VIDEO_WIDTH * 1.2)
+        target_h = int(Config.VIDEO_HEIGHT * 1.2)
+        prescale_dir = self.temp_dir / "prescaled"
+        prescale_dir.mkdir(parents=True, exist_ok=True)
+
+        def prescale(item):
+            index, img_path = item
+            try:
+                with Image.open(img_path) as img:
+                    if img.width <= target_w or img.height <= target_h:
+                        return img_path
+                    scale = max(target_w / img.width, target_h / img.height)
+                    resized = img.convert("RGB").resize(
+                        (round(img.width * scale), round(img.height * scale)),
+                        Image.LANCZOS,
+                    )
+                out = prescale_dir / f"{index:03d}_{img_path.stem}.jpg"
+                resized.save(out, quality=92)
+                return out
+            except OSError:
+                return img_path
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            return list(pool.map(prescale, enumerate(images)))
+
+    def _kenburns_frames(self, images: List[Path], duration: float):
+        """Yield raw RGB24 Ken Burns frames rendered with PIL.
+
+        Each image is scaled-and-cropped once to a slightly oversized canvas,
+        then per-frame zoom windows are cropped and resized to the target
+        resolution — mirroring the zoompan filter's slow zoom.
+        """
+        from PIL import Image
+
+        width, height = Config.VIDEO_WIDTH, Config.VIDEO_HEIGHT
+        frames_per_image = max(1, int(duration / len(images) * Config.VIDEO_FPS))
+        max_zoom = 1.1
+        pre_w, pre_h = int(width * max_zoom), int(height * max_zoom)
+
+        for img_path in images:
+            with Image.open(img_path) as img:
+                img = img.convert("RGB")
+                scale = max(pre_w / img.width, pre_h / img.height)
+                resized = img.resize(
+                    (round(img.width * scale), round(img.height * scale)),
+                    Image.BILINEAR,
+                )
+            left = (resized.width - pre_w) // 2
+            top = (resized.height - pre_h) // 2
+            canvas = resized.crop((left, top, left + pre_w, top + pre_h))
+
+            for frame_index in range(frames_per_image):
+                zoom = min(1.0 + 0.0015 * frame_index, max_zoom)
+                win_w = round(pre_w / zoom)
+                win_h = round(pre_h / zoom)
+                win_left = (pre_w - win_w) // 2
+                win_top = (pre_h - win_h) // 2
+                frame = canvas.crop(
+                    (win_left, win_top, win_left + win_w, win_top + win_h)
+                ).resize((width, height), Image.BILINEAR)
+                yield frame.tobytes()
+
+    def _create_video_via_pipe(
+        self,
+        images: List[Path],
+        duration: float,
+        subtitle_file: Path = None,
+    ) -> Path:
+        """Encode the Ken Burns slideshow from raw frames piped into ffmpeg.
+
+        Frame rendering (Python/PIL) and encoding (ffmpeg) run concurrently
+        on either side of the pipe, so neither side waits for the other to
+        finish. Returns None on any failure so callers can fall back to the
+        zoompan filter path.
+        """
+        output_path = self.temp_dir / "slideshow.mp4"
+
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            return None
+
+        cmd = [
+            "ffmpeg",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-s", f"{Config.VIDEO_WIDTH}x{Config.VIDEO_HEIGHT}",
+            "-r", str(Config.VIDEO_FPS),
+            "-i", "-",
+        ]
+        subtitle_filter = self._subtitle_filter(subtitle_file)
+        if subtitle_filter:
+            cmd.extend(["-vf", subtitle_filter])
+        cmd.extend([
+            *self._codec_args(),
+            "-movflags", "+faststart",
+            "-pix_fmt", "yuv420p",
+            "-y",
+            str(output_path),
+        ])
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            return None
+
+        try:
+            for frame in self._kenburns_frames(images, duration):
+                process.stdin.write(frame)
+        except (BrokenPipeError, OSError):
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            process.wait()
+
+        if process.returncode != 0:
+            return None
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            return None
+        return output_path
+
+    def _create_video_with_transitions(
+        self,
+        images: List[Path],
+        duration: float,
+        subtitle_file: Path = None,
+    ) -> Path:
         """Create slideshow with gentle crossfade transitions between still images."""
         output_path = self.temp_dir / "slideshow_transitions.mp4"
 
@@ -251,6 +675,12 @@ class VideoCompositor:
         transition = max(0.0, Config.TRANSITION_SECONDS)
         clip_duration = max(2.0, duration / image_count)
 
+        # Validate before spending an encode: xfade needs at least two inputs
+        # and a transition shorter than each clip, otherwise the offsets are
+        # guaranteed to be wrong and the fallback would re-encode everything.
+        if image_count < 2 or transition >= clip_duration:
+            return None
+
         input_args = []
         for img in images:
             input_args.extend(["-loop", "1", "-t", f"{clip_duration}", "-i", str(img)])
@@ -258,10 +688,7 @@ class VideoCompositor:
         vfilters = []
         for index in range(image_count):
             vfilters.append(
-                f"[{index}:v]scale={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT}:force_original_aspect_ratio=increase,"
-                f"crop={Config.VIDEO_WIDTH}:{Config.VIDEO_HEIGHT},"
-                f"format=yuv420p,"
-                f"settb=AVTB[v{index}]"
+                f"[{index}:v]{self._base_vf},format=yuv420p,settb=AVTB[v{index}]"
             )
 
         current = "v0"
@@ -273,6 +700,11 @@ class VideoCompositor:
             )
             current = out_tag
 
+        subtitle_filter = self._subtitle_filter(subtitle_file)
+        if subtitle_filter:
+            vfilters.append(f"[{current}]{subtitle_filter}[vsub]")
+            current = "vsub"
+
         filter_complex = ";".join(vfilters)
 
         cmd = [
@@ -280,14 +712,13 @@ class VideoCompositor:
             *input_args,
             "-filter_complex", filter_complex,
             "-map", f"[{current}]",
-            "-c:v", "libx264",
-            "-preset", "slow",
-            "-crf", "20",
-            "-profile:v", "high",
-            "-level", "4.2",
+            *self._codec_args(),
             "-movflags", "+faststart",
             "-pix_fmt", "yuv420p",
             "-r", str(Config.VIDEO_FPS),
+            # Cap the output so a bad xfade offset yields a truncated-but-valid
+            # file instead of an empty one that forces a full retry encode
+            "-t", f"{duration}",
             "-y",
             str(output_path),
         ]
@@ -303,87 +734,157 @@ class VideoCompositor:
 
         return output_path
     
+    def _create_video_single_pass(
+        self,
+        images: List[Path],
+        voice_audio: Path,
+        background_music: Path,
+        duration: float,
+        output_path: Path,
+        subtitle_file: Path = None,
+    ) -> Path:
+        """Compose the final video in one fused ffmpeg invocation.
+
+        Images, narration, and music enter a single -filter_complex that
+        crossfades the slideshow, burns subtitles, and mixes the audio, so
+        no intermediate slideshow or combined-audio files are written.
+        Returns None when the inputs don't fit this path (or the encode
+        fails) so create_video can fall back to the staged pipeline.
+        """
+        # Let the staged pipeline raise its usual ValueError for empty input
+        if not images:
+            return None
+
+        image_count = len(images)
+        transition = max(0.0, Config.TRANSITION_SECONDS)
+        clip_duration = max(2.0, duration / image_count)
+
+        # Multi-image slideshows need a usable crossfade; otherwise the
+        # staged pipeline's zoompan/concat path handles it better
+        if image_count >= 2 and not (0 < transition < clip_duration):
+            return None
+
+        images = self._prescale_images(images)
+
+        input_args = []
+        for img in images:
+            input_args.extend(["-loop", "1", "-t", f"{clip_duration}", "-i", str(img)])
+        voice_index = image_count
+        input_args.extend(["-i", str(voice_audio)])
+        has_music = bool(background_music and background_music.exists())
+        if has_music:
+            input_args.extend(["-stream_loop", "-1", "-i", str(background_music)])
+
+        filters = []
+        for index in range(image_count):
+            filters.append(
+                f"[{index}:v]{self._base_vf},format=yuv420p,settb=AVTB[v{index}]"
+            )
+
+        current = "v0"
+        for index in range(1, image_count):
+            offset = max(0.0, (clip_duration - transition) * index)
+            out_tag = f"xf{index}"
+            filters.append(
+                f"[{current}][v{index}]xfade=transition=fade:duration={transition}:offset={offset}[{out_tag}]"
+            )
+            current = out_tag
+
+        subtitle_filter = self._subtitle_filter(subtitle_file)
+        if subtitle_filter:
+            filters.append(f"[{current}]{subtitle_filter}[vsub]")
+            current = "vsub"
+
+        voice_chain = (
+            "loudnorm=I=-16:TP=-1.5:LRA=11" if Config.AUDIO_NORMALIZE else "anull"
+        )
+        if has_music:
+            fade_s = max(0, Config.MUSIC_FADE_MS) / 1000.0
+            music_chain = f"volume={_MUSIC_GAIN_DB:.2f}dB"
+            if fade_s > 0:
+                fade_out_start = max(0.0, duration - fade_s)
+                music_chain += (
+                    f",afade=t=in:d={fade_s}"
+                    f",afade=t=out:st={fade_out_start}:d={fade_s}"
+                )
+            filters.append(f"[{voice_index}:a]{voice_chain}[va]")
+            filters.append(f"[{voice_index + 1}:a]{music_chain}[ma]")
+            filters.append(
+                "[va][ma]amix=inputs=2:duration=first:dropout_transition=0[a]"
+            )
+        else:
+            filters.append(f"[{voice_index}:a]{voice_chain}[a]")
+
+        cmd = [
+            "ffmpeg",
+            *input_args,
+            "-filter_complex", ";".join(filters),
+            "-map", f"[{current}]",
+            "-map", "[a]",
+            *self._codec_args(),
+            "-c:a", "aac",
+            "-b:a", "192k",
+            "-movflags", "+faststart",
+            "-pix_fmt", "yuv420p",
+            "-r", str(Config.VIDEO_FPS),
+            "-t", f"{duration}",
+            "-shortest",
+            "-y",
+            str(output_path),
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            return None
+        return output_path
+
+    def _subtitle_filter(self, subtitle_file: Path = None) -> str:
+        """Return a subtitles filter string for *subtitle_file*, or ''."""
+        if not subtitle_file or not subtitle_file.exists():
+            return ""
+        subtitle_path = subtitle_file.resolve().as_posix().replace(":", "\\:")
+        return f"subtitles='{subtitle_path}'"
+
     def _combine_video_and_audio(
-        self, 
-        video_path: Path, 
-        audio_path: Path, 
+        self,
+        video_path: Path,
+        audio_path: Path,
         output_path: Path,
-        subtitle_text: str = None,
     ) -> Path:
         """
         Combine video and audio into final output.
-        
+
+        Subtitles are burned in during the slideshow encode, so this step
+        is always a video stream copy — no second libx264 pass.
+
         Args:
             video_path: Path to video file
             audio_path: Path to audio file
             output_path: Path for final output
-            
+
         Returns:
             Path to final video
         """
-        subtitle_file = None
-        use_subtitles = bool(subtitle_text and Config.SUBTITLES_ENABLED)
-
-        if use_subtitles:
-            duration = self._get_audio_duration(audio_path)
-            subtitle_file = self._create_subtitle_file(subtitle_text, duration)
+        cmd = [
+            "ffmpeg",
+            "-i", str(video_path),
+            "-i", str(audio_path),
+            "-c:v", "copy",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            "-movflags", "+faststart",
+            "-shortest",
+            "-y",
+            str(output_path)
+        ]
 
-        if subtitle_file and subtitle_file.exists():
-            subtitle_path = subtitle_file.resolve().as_posix().replace(":", "\\:")
-            subtitle_filter = f"subtitles='{subtitle_path}'"
-            cmd = [
-                "ffmpeg",
-                "-i", str(video_path),
-                "-i", str(audio_path),
-                "-vf", subtitle_filter,
-                "-c:v", "libx264",
-                "-preset", "slow",
-                "-crf", "20",
-                "-profile:v", "high",
-                "-level", "4.2",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                "-movflags", "+faststart",
-                "-shortest",
-                "-y",
-                str(output_path),
-            ]
-        else:
-            cmd = [
-                "ffmpeg",
-                "-i", str(video_path),
-                "-i", str(audio_path),
-                "-c:v", "copy",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                "-movflags", "+faststart",
-                "-shortest",
-                "-y",
-                str(output_path)
-            ]
-        
         result = subprocess.run(cmd, capture_output=True, text=True)
-        
+
         if result.returncode != 0:
-            if subtitle_file and subtitle_file.exists():
-                print("Subtitle burn-in failed, retrying without subtitles...")
-                fallback_cmd = [
-                    "ffmpeg",
-                    "-i", str(video_path),
-                    "-i", str(audio_path),
-                    "-c:v", "copy",
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-movflags", "+faststart",
-                    "-shortest",
-                    "-y",
-                    str(output_path)
-                ]
-                fallback = subprocess.run(fallback_cmd, capture_output=True, text=True)
-                if fallback.returncode == 0:
-                    return output_path
             raise Exception(f"FFmpeg error combining video and audio: {result.stderr}")
-        
+
         return output_path
 
     def _create_subtitle_file(self, script_text: str, duration: float) -> Path:
@@ -418,7 +919,7 @@ class VideoCompositor:
         if not cleaned:
             return []
 
-        sentences = re.split(r"(?<=[.!?])\s+", cleaned)
+        sentences = _SENT_RE.split(cleaned)
         chunks = []
 
         for sentence in sentences:
@@ -430,45 +931,37 @@ class VideoCompositor:
                 chunks.append(sentence)
                 continue
 
-            words = sentence.split()
-            current = []
-            current_len = 0
-            for word in words:
-                word_len = len(word) + (1 if current else 0)
-                if current_len + word_len > max_chars and current:
-                    chunks.append(" ".join(current))
-                    current = [word]
-                    current_len = len(word)
-                else:
-                    current.append(word)
-                    current_len += word_len
-            if current:
-                chunks.append(" ".join(current))
+            # Slice the sentence directly: break at the last space within the
+            # window, or mid-word if a single word exceeds max_chars
+            start = 0
+            length = len(sentence)
+            while start < length:
+                if length - start <= max_chars:
+                    chunks.append(sentence[start:])
+                    break
+                end = sentence.rfind(" ", start, start + max_chars + 1)
+                if end <= start:
+                    end = start + max_chars
+                chunks.append(sentence[start:end])
+                start = end + 1 if sentence[end:end + 1] == " " else end
 
         return chunks
 
     def _to_srt_time(self, seconds: float) -> str:
         """Convert seconds to SRT timestamp format."""
-        total_ms = max(0, int(seconds * 1000))
-        hours = total_ms // 3600000
-        minutes = (total_ms % 3600000) // 60000
-        secs = (total_ms % 60000) // 1000
-        millis = total_ms % 1000
+        hours, rem = divmod(max(0, int(seconds * 1000)), 3_600_000)
+        minutes, rem = divmod(rem, 60_000)
+        secs, millis = divmod(rem, 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
     
     def check_ffmpeg(self) -> bool:
         """
         Check if FFmpeg is installed.
-        
+
+        The result is cached process-wide, so repeated calls cost a
+        dictionary lookup rather than a subprocess spawn.
+
         Returns:
             True if FFmpeg is available, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        return _ffmpeg_available()
@@ -1,15 +1,111 @@
 """Fetch royalty-free visual assets for devotional videos."""
+import asyncio
 import base64
+import functools
+import logging
+import os
 import requests
+import shutil
+import threading
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# C-implemented JSON parsing when available — Gemini responses carry
+# multi-MB base64 strings where stdlib json is the bottleneck
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json as _stdlib_json
+    _loads = _stdlib_json.loads
+
+log = logging.getLogger(__name__)
+
+# Characters not allowed in image filenames derived from search queries
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+
+
+def _drop_page_cache(fd: int, length: int = 0):
+    """Tell the kernel we won't re-read this file soon (no-op off Linux).
+
+    A 30-image batch can park ~100 MB in the page cache between download
+    and composition; advising DONTNEED keeps that memory available.
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_DONTNEED)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket for pacing provider API calls.
+
+    acquire() blocks until a token is available, so bursts up to the bucket
+    capacity go straight through while sustained traffic is capped at the
+    refill rate — no fixed per-request sleep. 429 responses are handled
+    separately by the session's Retry (allowed_methods=None so POSTs are
+    covered), which honours Retry-After.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._cond.wait(timeout=(1 - self._tokens) / self._rate)
+
+_DEVOTIONAL_QUERIES = (
+    "hindu temple",
+    "lotus flower",
+    "diya lamp",
+    "peacock feather",
+    "sunrise spiritual",
+    "meditation nature",
+    "indian spiritual",
+    "sacred geometry",
+    "mandala art",
+    "spiritual light",
+    "temple bells",
+    "incense smoke",
+    "flower offering",
+    "spiritual garden",
+    "sacred river",
+)
+
 class VisualAssetFetcher:
     """Fetch royalty-free images and videos for Radha Krishna devotional content."""
-    
+
     def __init__(self):
         """Initialize the visual asset fetcher."""
         self.google_key = Config.GOOGLE_API_KEY
@@ -21,6 +117,54 @@ class VisualAssetFetcher:
             for p in Config.VISUAL_PROVIDER_ORDER.split(",")
             if p.strip()
         ]
+        # One pooled session for every provider call: urllib3 keeps the TLS
+        # connection to each API host warm across a batch of downloads, and
+        # transient errors are retried with backoff instead of failing a run
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Retry's default method list excludes POST, which would
+                # leave the Gemini generateContent calls without 429
+                # handling; generation requests are safe to re-send
+                allowed_methods=None,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        # Per-provider pacing: bursts pass immediately, sustained rates stay
+        # near what the old fixed sleeps allowed (0.5 s / 0.2 s per request)
+        self._rate_limits = {
+            "google": _TokenBucket(rate=5.0, capacity=5),
+            "pexels": _TokenBucket(rate=2.0, capacity=10),
+            "pixabay": _TokenBucket(rate=100 / 60, capacity=10),
+        }
+        # Resolve the provider chain once: entries without keys drop out
+        # here instead of being re-checked (and skipped) on every fetch
+        candidates = {
+            "google": (self.google_key, self._generate_with_google),
+            "pexels": (self.pexels_key, self._fetch_from_pexels),
+            "pixabay": (self.pixabay_key, self._fetch_from_pixabay),
+        }
+        order = self.visual_provider_order or ["google", "pexels", "pixabay"]
+        self._providers = [
+            (name, candidates[name][1])
+            for name in order
+            if name in candidates and candidates[name][0]
+        ]
+
+    def close(self):
+        """Release the pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def fetch_images(
         self, 
@@ -43,21 +187,14 @@ class VisualAssetFetcher:
         output_dir.mkdir(parents=True, exist_ok=True)
         images: List[Path] = []
 
-        provider_order = self.visual_provider_order or ["google", "pexels", "pixabay"]
-
-        for provider in provider_order:
-            if images:
-                break
-
+        for provider, fetch in self._providers:
             try:
-                if provider == "google" and self.google_key:
-                    images = self._generate_with_google(query, num_images, output_dir)
-                elif provider == "pexels" and self.pexels_key:
-                    images = self._fetch_from_pexels(query, num_images, output_dir)
-                elif provider == "pixabay" and self.pixabay_key:
-                    images = self._fetch_from_pixabay(query, num_images, output_dir)
+                images = fetch(query, num_images, output_dir)
             except Exception as e:
                 print(f"{provider.title()} visual generation failed: {e}")
+
+            if images:
+                break
         
         # If no API keys or both failed, provide guidance
         if not images:
@@ -68,9 +205,11 @@ class VisualAssetFetcher:
         
         return images
 
-    def _sanitize_query(self, query: str) -> str:
-        """Return a filesystem-safe query string."""
-        cleaned = re.sub(r"[^a-zA-Z0-9_-]+", "_", query.strip().lower())
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _sanitize_query(query: str) -> str:
+        """Return a filesystem-safe query string (cached per query)."""
+        cleaned = _SLUG_RE.sub("_", query.strip().lower())
         return cleaned.strip("_") or "scene"
 
     def _generate_with_google(
@@ -93,21 +232,36 @@ class VisualAssetFetcher:
             "soft spiritual ambience, natural colors, suitable for video storytelling."
         )
 
-        image_paths: List[Path] = []
-        for idx in range(num_images):
-            payload = {
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {
-                    "responseModalities": ["TEXT", "IMAGE"],
-                    "temperature": 0.8,
-                },
-            }
+        payload = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "responseModalities": ["TEXT", "IMAGE"],
+                "temperature": 0.8,
+            },
+        }
 
-            response = requests.post(url, params=params, json=payload, timeout=60)
-            response.raise_for_status()
-            data = response.json()
+        # Gemini generations are multi-second round trips; fan them out
+        # concurrently when httpx is available instead of paying N in series
+        if HTTPX_AVAILABLE and num_images > 1:
+            try:
+                return asyncio.run(
+                    self._generate_with_google_async(
+                        url, params, payload, query, query_slug, num_images, output_dir
+                    )
+                )
+            except Exception as e:
+                print(f"Async Gemini generation failed ({e}), falling back to serial requests...")
 
-            image_bytes = self._extract_image_bytes(data)
+        image_paths: List[Path] = []
+        for idx in range(num_images):
+            self._rate_limits["google"].acquire()
+            # Close the response even when ijson stops mid-stream, or the
+            # partially read connection can never return to the pool
+            with self.session.post(
+                url, params=params, json=payload, timeout=60, stream=IJSON_AVAILABLE
+            ) as response:
+                response.raise_for_status()
+                image_bytes = self._image_bytes_from_response(response)
             if not image_bytes:
                 raise RuntimeError(
                     f"Google image response did not include image bytes for query '{query}'"
@@ -116,13 +270,75 @@ class VisualAssetFetcher:
             image_path = output_dir / f"google_{query_slug}_{idx+1:03d}.png"
             with open(image_path, "wb") as f:
                 f.write(image_bytes)
+                f.flush()
+                _drop_page_cache(f.fileno(), len(image_bytes))
 
             image_paths.append(image_path)
-            print(f"Generated: {image_path.name}")
-            time.sleep(0.2)
+            log.info("Generated: %s", image_path.name)
 
         return image_paths
 
+    async def _generate_with_google_async(
+        self,
+        url: str,
+        params: Dict,
+        payload: Dict,
+        query: str,
+        query_slug: str,
+        num_images: int,
+        output_dir: Path,
+    ) -> List[Path]:
+        """Run Gemini generations concurrently over one multiplexed client.
+
+        A semaphore bounds in-flight requests so pacing comes from
+        concurrency control rather than fixed sleeps; file writes go through
+        a thread so the event loop never blocks on disk.
+        """
+        semaphore = asyncio.Semaphore(4)
+        limits = httpx.Limits(max_keepalive_connections=8)
+
+        async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+
+            async def generate(idx: int) -> Path:
+                async with semaphore:
+                    # Same pacing as the serial path; acquire off-loop so a
+                    # drained bucket doesn't stall the other coroutines
+                    await asyncio.to_thread(self._rate_limits["google"].acquire)
+                    response = await client.post(url, params=params, json=payload)
+                    response.raise_for_status()
+
+                    image_bytes = self._extract_image_bytes(_loads(response.content))
+                    if not image_bytes:
+                        raise RuntimeError(
+                            f"Google image response did not include image bytes for query '{query}'"
+                        )
+
+                    image_path = output_dir / f"google_{query_slug}_{idx+1:03d}.png"
+                    await asyncio.to_thread(image_path.write_bytes, image_bytes)
+                    log.info("Generated: %s", image_path.name)
+                    return image_path
+
+            return list(await asyncio.gather(*(generate(i) for i in range(num_images))))
+
+    def _image_bytes_from_response(self, response) -> bytes:
+        """Pull the inline image bytes out of a Gemini response.
+
+        With ijson the multi-MB base64 payload is parsed incrementally off
+        the wire, skipping construction of the full response dict; without
+        it the stdlib json walk in _extract_image_bytes is used.
+        """
+        if IJSON_AVAILABLE:
+            response.raw.decode_content = True
+            encoded = next(
+                ijson.items(
+                    response.raw,
+                    "candidates.item.content.parts.item.inlineData.data",
+                ),
+                None,
+            )
+            return base64.b64decode(encoded) if encoded else b""
+        return self._extract_image_bytes(_loads(response.content))
+
     def _extract_image_bytes(self, response_json: Dict) -> bytes:
         """Extract inline image bytes from Gemini generateContent response."""
         for candidate in response_json.get("candidates", []):
@@ -135,6 +351,60 @@ class VisualAssetFetcher:
 
         return b""
     
+    def _download_one(self, job, bucket: _TokenBucket = None) -> Path:
+        """Download a single (url, path) job over the pooled session.
+
+        Bytes stream through a 64 KiB buffer straight to disk instead of
+        materializing the whole image in memory first.
+        """
+        url, path = job
+        if bucket is not None:
+            bucket.acquire()
+        with self.session.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=65536)
+                f.flush()
+                _drop_page_cache(f.fileno())
+        log.info("Downloaded: %s", path.name)
+        return path
+
+    def _download_urls(
+        self,
+        provider: str,
+        urls: List[str],
+        output_dir: Path,
+        query_slug: str,
+        ext: str = "jpg",
+    ) -> List[Path]:
+        """Download provider image URLs with the shared naming and pacing.
+
+        Single home for the download loop both stock providers used to
+        duplicate, so pooling, streaming, and rate limiting apply in one
+        place.
+        """
+        jobs = [
+            (url, output_dir / f"{provider}_{query_slug}_{i+1:03d}.{ext}")
+            for i, url in enumerate(urls)
+        ]
+        return self._download_parallel(jobs, bucket=self._rate_limits.get(provider))
+
+    def _download_parallel(
+        self, jobs: List[tuple], bucket: _TokenBucket = None
+    ) -> List[Path]:
+        """Download image URLs concurrently, preserving job order.
+
+        The stock CDNs serve images happily in parallel; the worker bound
+        plus the provider's token bucket keep concurrency polite instead of
+        the old fixed 0.5 s sleep between serial downloads.
+        """
+        if not jobs:
+            return []
+        download = functools.partial(self._download_one, bucket=bucket)
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+            return list(pool.map(download, jobs))
+
     def _fetch_from_pexels(
         self, 
         query: str, 
@@ -151,30 +421,14 @@ class VisualAssetFetcher:
             "orientation": "landscape"
         }
         
-        response = requests.get(url, headers=headers, params=params)
+        self._rate_limits["pexels"].acquire()
+        response = self.session.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
-        image_paths = []
-        
-        for i, photo in enumerate(data.get("photos", [])):
-            image_url = photo["src"]["large"]
-            image_path = output_dir / f"pexels_{query}_{i+1:03d}.jpg"
-            
-            # Download image
-            img_response = requests.get(image_url)
-            img_response.raise_for_status()
-            
-            with open(image_path, "wb") as f:
-                f.write(img_response.content)
-            
-            image_paths.append(image_path)
-            print(f"Downloaded: {image_path.name}")
-            
-            # Be respectful with API rate limits
-            time.sleep(0.5)
-        
-        return image_paths
+        data = _loads(response.content)
+
+        urls = [photo["src"]["large"] for photo in data.get("photos", [])]
+        return self._download_urls("pexels", urls, output_dir, self._sanitize_query(query))
     
     def _fetch_from_pixabay(
         self, 
@@ -193,50 +447,18 @@ class VisualAssetFetcher:
             "per_page": num_images
         }
         
-        response = requests.get(url, params=params)
+        self._rate_limits["pixabay"].acquire()
+        response = self.session.get(url, params=params, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
-        image_paths = []
-        
-        for i, hit in enumerate(data.get("hits", [])):
-            image_url = hit["largeImageURL"]
-            image_path = output_dir / f"pixabay_{query}_{i+1:03d}.jpg"
-            
-            # Download image
-            img_response = requests.get(image_url)
-            img_response.raise_for_status()
-            
-            with open(image_path, "wb") as f:
-                f.write(img_response.content)
-            
-            image_paths.append(image_path)
-            print(f"Downloaded: {image_path.name}")
-            
-            # Be respectful with API rate limits
-            time.sleep(0.5)
-        
-        return image_paths
+        data = _loads(response.content)
+
+        urls = [hit["largeImageURL"] for hit in data.get("hits", [])]
+        return self._download_urls("pixabay", urls, output_dir, self._sanitize_query(query))
     
     def get_devotional_queries(self) -> List[str]:
         """Get search queries for devotional visuals."""
-        return [
-            "hindu temple",
-            "lotus flower",
-            "diya lamp",
-            "peacock feather",
-            "sunrise spiritual",
-            "meditation nature",
-            "indian spiritual",
-            "sacred geometry",
-            "mandala art",
-            "spiritual light",
-            "temple bells",
-            "incense smoke",
-            "flower offering",
-            "spiritual garden",
-            "sacred river"
-        ]
+        return list(_DEVOTIONAL_QUERIES)
     
     def fetch_diverse_images(
         self, 
@@ -255,15 +477,23 @@ class VisualAssetFetcher:
         """
         queries = self.get_devotional_queries()
         images_per_query = max(2, num_total // len(queries))
-        
+
         all_images = []
-        
-        for query in queries[:num_total // images_per_query]:
-            print(f"\nFetching images for: {query}")
-            images = self.fetch_images(query, images_per_query, output_dir)
-            all_images.extend(images)
-            
-            if len(all_images) >= num_total:
-                break
-        
+
+        # Run several search+download pipelines concurrently; queries are
+        # independent and the pooled session is safe to share across threads
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                pool.submit(self.fetch_images, query, images_per_query, output_dir): query
+                for query in queries[: num_total // images_per_query]
+            }
+            for future in as_completed(futures):
+                log.info("Fetched images for: %s", futures[future])
+                all_images.extend(future.result())
+
+                if len(all_images) >= num_total:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
         return all_images[:num_total]
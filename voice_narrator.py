@@ -1,8 +1,15 @@
 """Text-to-speech module for generating voice narration."""
+import hashlib
+import logging
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from gtts import gTTS
 from config import Config
+from pipeline_cache import cache_audio_path, get_cached_audio_path
+
+log = logging.getLogger(__name__)
 
 try:
     from elevenlabs import generate, save, set_api_key
@@ -59,6 +66,16 @@ class VoiceNarrator:
         Returns:
             Path to generated audio file
         """
+        # Identical text + language means identical audio, so reuse earlier
+        # output instead of another round trip to the TTS service
+        key = self._tts_cache_key(script, Config.VOICE_LANGUAGE)
+        if Config.ENABLE_CACHE:
+            cached = get_cached_audio_path(key)
+            if cached:
+                shutil.copy2(cached, output_path)
+                log.info("Reusing cached narration: %s", output_path)
+                return output_path
+
         try:
             # Use slow=True for more deliberate, meditative pace
             tts = gTTS(
@@ -66,13 +83,22 @@ class VoiceNarrator:
                 lang=Config.VOICE_LANGUAGE,
                 slow=False  # We'll adjust speed in post-processing if needed
             )
-            
+
             tts.save(str(output_path))
-            print(f"Generated narration using gTTS: {output_path}")
+            if Config.ENABLE_CACHE:
+                shutil.copy2(output_path, cache_audio_path(key))
+            log.info("Generated narration using gTTS: %s", output_path)
             return output_path
-            
+
         except Exception as e:
             raise Exception(f"Error generating narration with gTTS: {str(e)}")
+
+    @staticmethod
+    def _tts_cache_key(script: str, lang: str) -> str:
+        """Stable cache key for TTS audio: language plus exact script text."""
+        return hashlib.blake2b(
+            f"{lang}\x00{script}".encode(), digest_size=16
+        ).hexdigest()
     
     def _generate_with_elevenlabs(self, script: str, output_path: Path) -> Path:
         """
@@ -94,7 +120,7 @@ class VoiceNarrator:
             )
             
             save(audio, str(output_path))
-            print(f"Generated narration using ElevenLabs: {output_path}")
+            log.info("Generated narration using ElevenLabs: %s", output_path)
             return output_path
             
         except Exception as e:
@@ -117,17 +143,38 @@ class VoiceNarrator:
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        audio_files = []
-        
+
+        # Repeated segment text (refrains are common in devotional scripts)
+        # should cost one TTS round trip; later occurrences copy the first
+        # segment's audio instead of regenerating it
+        paths = [output_dir / f"segment_{i+1:02d}.mp3" for i in range(len(segments))]
+        first_index = {}
+        duplicates = []
+        unique = []
         for i, segment in enumerate(segments):
-            output_file = output_dir / f"segment_{i+1:02d}.mp3"
-            
-            print(f"Generating narration for segment {i+1}/{len(segments)}...")
-            audio_path = self.generate_narration(
-                segment['content'],
-                output_file
+            text = segment['content']
+            if text in first_index:
+                duplicates.append((first_index[text], i))
+            else:
+                first_index[text] = i
+                unique.append(i)
+
+        # Each narration is a blocking TTS round trip; run a few at a time
+        # so a multi-segment script doesn't pay for them back to back
+        print(f"Generating narration for {len(segments)} segments ({len(unique)} unique)...")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(self.generate_narration, segments[i]['content'], paths[i])
+                for i in unique
+            ]
+            for future in futures:
+                future.result()
+
+        for src, dst in duplicates:
+            shutil.copy2(paths[src], paths[dst])
+            log.info(
+                "Reused narration for segment %d (same text as segment %d)",
+                dst + 1, src + 1,
             )
-            audio_files.append(audio_path)
-        
-        return audio_files
+
+        return paths